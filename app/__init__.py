@@ -1,7 +1,9 @@
 import os
-from flask import Flask, jsonify
+import click
+import orjson
+from flask import Flask, Response, request
 from flask_cors import CORS
-from app.models import db
+from app.models import Todo, db
 from app.routes import api
 from app.config import config
 
@@ -12,6 +14,8 @@ def create_app(config_name=None):
         config_name = os.getenv('FLASK_ENV', 'development')
 
     app = Flask(__name__)
+    # Serve /api/todos and /api/todos/ alike instead of redirecting with a 308
+    app.url_map.strict_slashes = False
     app.config.from_object(config[config_name])
     config[config_name].init_app(app)
 
@@ -34,42 +38,59 @@ def create_app(config_name=None):
     db.init_app(app)
     app.register_blueprint(api, url_prefix='/api')
 
+    # Static payloads are serialized once per app instead of on every request
+    index_body = orjson.dumps({
+        'message': 'Flask Todo API',
+        'version': '1.0.0',
+        'endpoints': {
+            'health': '/api/health',
+            'todos': '/api/todos'
+        }
+    })
+    not_found_body = orjson.dumps({
+        'success': False,
+        'error': 'Resource not found'
+    })
+    internal_error_body = orjson.dumps({
+        'success': False,
+        'error': 'Internal server error'
+    })
+
     @app.route('/')
     def index():
-        return jsonify({
-            'message': 'Flask Todo API',
-            'version': '1.0.0',
-            'endpoints': {
-                'health': '/api/health',
-                'todos': '/api/todos'
-            }
-        })
+        if request.method == 'HEAD':
+            # Probes only need the headers; skip building the body
+            response = Response(mimetype='application/json')
+            response.content_length = len(index_body)
+        else:
+            response = Response(index_body, mimetype='application/json')
+        response.cache_control.public = True
+        response.cache_control.max_age = 3600
+        return response
 
     @app.errorhandler(404)
     def not_found(error):
-        return jsonify({
-            'success': False,
-            'error': 'Resource not found'
-        }), 404
+        return Response(not_found_body, status=404, mimetype='application/json')
 
+    # No rollback in the handlers: Flask-SQLAlchemy's app context teardown
+    # removes the session, which rolls back any open transaction.
     @app.errorhandler(500)
     def internal_error(error):
-        db.session.rollback()
-        return jsonify({
-            'success': False,
-            'error': 'Internal server error'
-        }), 500
+        return Response(internal_error_body, status=500, mimetype='application/json')
 
     @app.errorhandler(Exception)
     def handle_exception(error):
         """Handle all unhandled exceptions"""
-        db.session.rollback()
-        return jsonify({
-            'success': False,
-            'error': 'Internal server error'
-        }), 500
+        return Response(internal_error_body, status=500, mimetype='application/json')
 
-    with app.app_context():
+    @app.cli.command('init-db')
+    def init_db():
+        """Create database tables (run once per deploy, not per worker)"""
         db.create_all()
+        # create_all() skips existing tables along with their indexes, so add
+        # any index declared on the model after the table was first created
+        for index in Todo.__table__.indexes:
+            index.create(db.engine, checkfirst=True)
+        click.echo('Initialized the database.')
 
     return app
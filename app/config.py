@@ -2,7 +2,9 @@ import os
 
 from dotenv import load_dotenv
 
-load_dotenv()
+# Production env vars come from the orchestrator; only read .env locally
+if os.getenv("FLASK_ENV", "development") != "production":
+    load_dotenv()
 
 
 class Config:
@@ -10,6 +12,16 @@ class Config:
 
     SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # One pooled connection per gunicorn worker thread; the pool is per worker
+    # process, so the database sees workers * threads connections in total
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.getenv("GUNICORN_THREADS", 4)),
+        "max_overflow": 2,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+    # Reuse a successful /api/health database probe for this many seconds
+    HEALTH_CHECK_CACHE_SECONDS = 2
 
     @staticmethod
     def init_app(app):
@@ -28,6 +40,9 @@ class TestingConfig(Config):
 
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    # In-memory SQLite runs on a StaticPool, which takes no pool sizing options
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+    HEALTH_CHECK_CACHE_SECONDS = 0
     WTF_CSRF_ENABLED = False
 
 
@@ -37,11 +52,16 @@ class ProductionConfig(Config):
     DEBUG = False
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL")
 
+    @classmethod
+    def validate(cls):
+        """Check the production environment without building an app"""
+        assert os.getenv("DATABASE_URL"), "DATABASE_URL must be set in production"
+
     @classmethod
     def init_app(cls, app):
         Config.init_app(app)
         # Production-specific initialization
-        assert os.getenv("DATABASE_URL"), "DATABASE_URL must be set in production"
+        cls.validate()
 
 
 config = {
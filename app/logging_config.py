@@ -1,19 +1,18 @@
 import logging
 import sys
 
+# Built once per process and shared by every app instance
+_HANDLER = logging.StreamHandler(sys.stdout)
+_HANDLER.setLevel(logging.INFO)
+_HANDLER.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+
 
 def setup_logging(app):
     """Configure application logging to stdout with a consistent format."""
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(logging.INFO)
-
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    handler.setFormatter(formatter)
-
     # ล้าง handler เดิมเพื่อกันซ้ำ
-    if app.logger.handlers:
+    if app.logger.handlers != [_HANDLER]:
         app.logger.handlers.clear()
+        app.logger.addHandler(_HANDLER)
 
-    app.logger.addHandler(handler)
     app.logger.setLevel(logging.INFO)
     return app.logger
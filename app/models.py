@@ -9,23 +9,27 @@ class Todo(db.Model):
     """Todo item model"""
 
     __tablename__ = "todos"
+    __table_args__ = (db.Index("ix_todos_created_at_id", db.desc("created_at"), db.desc("id")),)
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text)
     completed = db.Column(db.Boolean, default=False, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Indexed so the list ETag's MAX(updated_at) is an index lookup, not a scan
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True
+    )
 
     def to_dict(self):
-        """Convert model to dictionary for JSON serialization"""
+        """Convert model to dictionary for JSON serialization (orjson encodes the datetimes)"""
         return {
             "id": self.id,
             "title": self.title,
             "description": self.description,
             "completed": self.completed,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
     def __repr__(self):
@@ -1,133 +1,269 @@
-from flask import Blueprint, jsonify, request
+import base64
+import binascii
+import hashlib
+import time
+from datetime import datetime
+
+import msgspec
+import orjson
+from flask import Blueprint, Response, current_app, request
+from sqlalchemy import bindparam, delete, func, insert, select, tuple_, update
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import raiseload
 
 from app.models import Todo, db
+from app.schemas import todo_create_decoder, todo_update_decoder
 
 api = Blueprint("api", __name__)
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+_MAX_TODO_ID = 2**63 - 1
+
+_TODO_COLUMNS = (
+    Todo.id,
+    Todo.title,
+    Todo.description,
+    Todo.completed,
+    Todo.created_at,
+    Todo.updated_at,
+)
+
+# Statements are built once so each request only binds parameters and hits
+# SQLAlchemy's compiled-statement cache.
+# Reads the todos table rather than SELECT 1, so a database that never had
+# `flask init-db` run against it reports unhealthy instead of passing checks
+_HEALTH_STMT = select(Todo.id).limit(1)
+_STATS_STMT = select(func.max(Todo.updated_at), func.count(Todo.id))
+_LIST_STMT = (
+    select(*_TODO_COLUMNS)
+    .order_by(Todo.created_at.desc(), Todo.id.desc())
+    .limit(bindparam("limit"))
+)
+_LIST_AFTER_CURSOR_STMT = _LIST_STMT.where(
+    tuple_(Todo.created_at, Todo.id)
+    < tuple_(
+        bindparam("cursor_created_at", type_=Todo.created_at.type),
+        bindparam("cursor_id", type_=Todo.id.type),
+    )
+)
+_GET_STMT = select(*_TODO_COLUMNS).where(Todo.id == bindparam("todo_id"))
+_INSERT_STMT = insert(Todo).returning(*_TODO_COLUMNS)
+_UPDATE_STMT = update(Todo).where(Todo.id == bindparam("todo_id")).returning(*_TODO_COLUMNS)
+_DELETE_STMT = delete(Todo).where(Todo.id == bindparam("todo_id"))
+
+# Monotonic time of the last successful database probe, shared by the process
+_last_healthy_probe = [float("-inf")]
+
+
+def _todo_load_options():
+    """Loader options for Todo entities.
+
+    Under testing every lazy load raises, so a relationship added later without
+    an explicit eager load (e.g. selectinload) fails CI instead of causing N+1.
+    """
+    return [raiseload("*")] if current_app.testing else []
+
+
+def _todos_etag():
+    """Build an ETag for the todo collection from its latest update and row count.
+
+    MAX(updated_at) is served by its index and catches inserts and updates;
+    COUNT(id) is what catches deletes and is still O(N) on the table.
+    """
+    latest, count = db.session.execute(_STATS_STMT).one()
+    return hashlib.blake2b(f"{latest}:{count}".encode(), digest_size=16).hexdigest()
+
+
+def _with_validators(response, etag):
+    """Attach the list ETag and revalidation headers to a 200 or 304 response"""
+    response.set_etag(etag)
+    response.cache_control.max_age = 0
+    response.cache_control.must_revalidate = True
+    return response
+
+
+def _json(payload, status=200):
+    """Serialize payload with orjson straight into a JSON Response"""
+    return Response(orjson.dumps(payload), status=status, mimetype="application/json")
+
+
+def _encode_cursor(row):
+    """Encode the (created_at, id) position of a row as an opaque cursor"""
+    raw = f"{row['created_at'].isoformat()},{row['id']}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor):
+    """Decode a cursor back to (created_at, id); raises ValueError when malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    created_at, _, todo_id = raw.rpartition(",")
+    if not created_at:
+        raise ValueError("Invalid cursor")
+    todo_id = int(todo_id)
+    # Out-of-range ids would otherwise fail only when bound as a 64-bit integer
+    if not 0 < todo_id <= _MAX_TODO_ID:
+        raise ValueError("Invalid cursor")
+    return datetime.fromisoformat(created_at), todo_id
+
 
 @api.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint for monitoring"""
+    now = time.monotonic()
+    if now - _last_healthy_probe[0] < current_app.config["HEALTH_CHECK_CACHE_SECONDS"]:
+        return _json({"status": "healthy", "database": "connected"}, 200)
+
     try:
-        db.session.execute(db.text("SELECT 1"))
-        return jsonify({"status": "healthy", "database": "connected"}), 200
+        db.session.execute(_HEALTH_STMT)
+        _last_healthy_probe[0] = now
+        return _json({"status": "healthy", "database": "connected"}, 200)
     except Exception:
-        return (
-            jsonify(
-                {
-                    "status": "unhealthy",
-                    "database": "disconnected",
-                    "error": "Database connection failed",
-                }
-            ),
+        _last_healthy_probe[0] = float("-inf")
+        return _json(
+            {
+                "status": "unhealthy",
+                "database": "disconnected",
+                "error": "Database connection failed",
+            },
             503,
         )
 
 
 @api.route("/todos", methods=["GET"])
 def get_todos():
-    """Get all todo items"""
+    """Get a page of todo items, newest first"""
+    try:
+        limit = min(max(int(request.args.get("limit", DEFAULT_PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+    except ValueError:
+        return _json({"success": False, "error": "Invalid limit"}, 400)
+
+    cursor = request.args.get("cursor")
+    try:
+        position = _decode_cursor(cursor) if cursor else None
+    except ValueError:
+        return _json({"success": False, "error": "Invalid cursor"}, 400)
+
     try:
-        todos = Todo.query.order_by(Todo.created_at.desc()).all()
-        return (
-            jsonify(
-                {
-                    "success": True,
-                    "data": [todo.to_dict() for todo in todos],
-                    "count": len(todos),
-                }
-            ),
+        etag = _todos_etag()
+        # If-None-Match uses weak comparison, so W/"..." from proxies still matches
+        if request.if_none_match.contains_weak(etag):
+            return _with_validators(Response(status=304), etag)
+
+        if position is None:
+            result = db.session.execute(_LIST_STMT, {"limit": limit})
+        else:
+            cursor_created_at, cursor_id = position
+            result = db.session.execute(
+                _LIST_AFTER_CURSOR_STMT,
+                {"limit": limit, "cursor_created_at": cursor_created_at, "cursor_id": cursor_id},
+            )
+        rows = result.mappings().all()
+        response = _json(
+            {
+                "success": True,
+                # orjson formats naive datetimes exactly like isoformat(), in C
+                "data": [dict(row) for row in rows],
+                "count": len(rows),
+                "next_cursor": _encode_cursor(rows[-1]) if len(rows) == limit else None,
+            },
             200,
         )
+        return _with_validators(response, etag)
     except SQLAlchemyError:
-        return jsonify({"success": False, "error": "Database error occurred"}), 500
+        return _json({"success": False, "error": "Database error occurred"}, 500)
 
 
 @api.route("/todos/<int:todo_id>", methods=["GET"])
 def get_todo(todo_id):
     """Get a specific todo item"""
-    todo = Todo.query.get(todo_id)
+    todo = db.session.get(Todo, todo_id, options=_todo_load_options())
     if not todo:
-        return jsonify({"success": False, "error": "Todo not found"}), 404
+        return _json({"success": False, "error": "Todo not found"}, 404)
 
-    return jsonify({"success": True, "data": todo.to_dict()}), 200
+    return _json({"success": True, "data": todo.to_dict()}, 200)
 
 
 @api.route("/todos", methods=["POST"])
 def create_todo():
     """Create a new todo item"""
-    data = request.get_json()
+    try:
+        data = todo_create_decoder.decode(request.get_data())
+    except msgspec.DecodeError as exc:
+        return _json({"success": False, "error": f"Invalid request body: {exc}"}, 400)
 
-    if not data or not data.get("title"):
-        return jsonify({"success": False, "error": "Title is required"}), 400
+    if not data.title:
+        return _json({"success": False, "error": "Title is required"}, 400)
 
     try:
-        todo = Todo(title=data["title"], description=data.get("description", ""))
-        db.session.add(todo)
+        row = db.session.execute(
+            _INSERT_STMT, {"title": data.title, "description": data.description}
+        ).mappings().one()
         db.session.commit()
 
-        return (
-            jsonify(
-                {
-                    "success": True,
-                    "data": todo.to_dict(),
-                    "message": "Todo created successfully",
-                }
-            ),
+        return _json(
+            {
+                "success": True,
+                "data": dict(row),
+                "message": "Todo created successfully",
+            },
             201,
         )
     except SQLAlchemyError:
         db.session.rollback()
-        return jsonify({"success": False, "error": "Failed to create todo"}), 500
+        return _json({"success": False, "error": "Failed to create todo"}, 500)
 
 
 @api.route("/todos/<int:todo_id>", methods=["PUT"])
 def update_todo(todo_id):
     """Update an existing todo item"""
-    todo = Todo.query.get(todo_id)
-    if not todo:
-        return jsonify({"success": False, "error": "Todo not found"}), 404
+    # The body is validated before the row is looked up, so a malformed body
+    # is a 400 even for a missing id; the single UPDATE ... RETURNING needs
+    # decoded values before it can tell whether the row exists
+    try:
+        data = todo_update_decoder.decode(request.get_data())
+    except msgspec.DecodeError as exc:
+        return _json({"success": False, "error": f"Invalid request body: {exc}"}, 400)
 
-    data = request.get_json()
+    values = {field: getattr(data, field) for field in data.__struct_fields__}
+    values = {field: value for field, value in values.items() if value is not msgspec.UNSET}
 
     try:
-        if "title" in data:
-            todo.title = data["title"]
-        if "description" in data:
-            todo.description = data["description"]
-        if "completed" in data:
-            todo.completed = data["completed"]
+        # One UPDATE ... RETURNING round-trip; an empty body just reads the row back
+        stmt = _UPDATE_STMT if values else _GET_STMT
+        row = db.session.execute(stmt, {"todo_id": todo_id, **values}).mappings().one_or_none()
+        if row is None:
+            return _json({"success": False, "error": "Todo not found"}, 404)
 
         db.session.commit()
 
-        return (
-            jsonify(
-                {
-                    "success": True,
-                    "data": todo.to_dict(),
-                    "message": "Todo updated successfully",
-                }
-            ),
+        return _json(
+            {
+                "success": True,
+                "data": dict(row),
+                "message": "Todo updated successfully",
+            },
             200,
         )
     except SQLAlchemyError:
         db.session.rollback()
-        return jsonify({"success": False, "error": "Failed to update todo"}), 500
+        return _json({"success": False, "error": "Failed to update todo"}, 500)
 
 
 @api.route("/todos/<int:todo_id>", methods=["DELETE"])
 def delete_todo(todo_id):
     """Delete a todo item"""
-    todo = Todo.query.get(todo_id)
-    if not todo:
-        return jsonify({"success": False, "error": "Todo not found"}), 404
-
     try:
-        db.session.delete(todo)
+        result = db.session.execute(_DELETE_STMT, {"todo_id": todo_id})
+        if result.rowcount == 0:
+            return _json({"success": False, "error": "Todo not found"}, 404)
+
         db.session.commit()
 
-        return jsonify({"success": True, "message": "Todo deleted successfully"}), 200
+        return _json({"success": True, "message": "Todo deleted successfully"}, 200)
     except SQLAlchemyError:
         db.session.rollback()
-        return jsonify({"success": False, "error": "Failed to delete todo"}), 500
+        return _json({"success": False, "error": "Failed to delete todo"}, 500)
@@ -0,0 +1,20 @@
+import msgspec
+
+
+class TodoCreate(msgspec.Struct):
+    """Request body for creating a todo"""
+
+    title: str = ""
+    description: str | None = ""
+
+
+class TodoUpdate(msgspec.Struct):
+    """Request body for updating a todo; omitted fields are left unchanged"""
+
+    title: str | msgspec.UnsetType = msgspec.UNSET
+    description: str | None | msgspec.UnsetType = msgspec.UNSET
+    completed: bool | msgspec.UnsetType = msgspec.UNSET
+
+
+todo_create_decoder = msgspec.json.Decoder(TodoCreate)
+todo_update_decoder = msgspec.json.Decoder(TodoUpdate)
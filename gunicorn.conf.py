@@ -0,0 +1,27 @@
+import math
+import os
+
+
+def _available_cpus():
+    """CPUs this container may use: cgroup v2 quota, else the affinity mask"""
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    return len(os.sched_getaffinity(0))
+
+
+# Gunicorn reads this file automatically from the working directory
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+# cpu_count() reports host CPUs, which oversizes workers under a container limit
+workers = int(os.getenv("WEB_CONCURRENCY", _available_cpus() * 2 + 1))
+
+# Threaded workers keep connections alive and overlap DB waits within a process
+worker_class = "gthread"
+# Also sizes each worker's DB pool (see Config.SQLALCHEMY_ENGINE_OPTIONS)
+threads = int(os.getenv("GUNICORN_THREADS", 4))
+keepalive = 5
+timeout = 120
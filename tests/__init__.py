@@ -42,8 +42,4 @@ def create_app(config_name=None):
     def internal_error(error):
         return jsonify({"success": False, "error": "Internal server error"}), 500
 
-    # Create tables
-    with app.app_context():
-        db.create_all()
-
     return app
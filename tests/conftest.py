@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from app import create_app
+from app.config import TestingConfig
+from app.models import db
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_engine():
+    """One in-memory SQLite connection for every app built during the session.
+
+    Each ``create_app("testing")`` still gets its own Flask-SQLAlchemy engine,
+    but it is created with ``creator=`` pointing at this engine's single
+    connection, so no new DBAPI connection, pool or database is set up per app.
+    """
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    # Keep the connection checked out for the whole session; letting the proxy
+    # be garbage-collected would return it to the pool and roll back whatever
+    # transaction an app has open on it.
+    shared_connection = engine.raw_connection()
+
+    original_options = TestingConfig.SQLALCHEMY_ENGINE_OPTIONS
+    TestingConfig.SQLALCHEMY_ENGINE_OPTIONS = {"creator": lambda: shared_connection.driver_connection}
+    yield engine
+    TestingConfig.SQLALCHEMY_ENGINE_OPTIONS = original_options
+
+    shared_connection.close()
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def app_no_db():
+    """Shared testing app without a schema, built once per session.
+
+    TestingConfig is read-only, so every test can use the same instance.
+    Modules that change app state (routes, config) define their own
+    function-scoped ``app`` fixture instead. Under pytest-xdist each worker
+    builds its own instance, so nothing is shared across processes.
+    """
+    app = create_app("testing")
+
+    with app.app_context():
+        yield app
+        db.session.remove()
+
+
+@pytest.fixture(scope="session")
+def app_with_db(app_no_db):
+    """The shared testing app with its tables created, for tests that query."""
+    db.create_all()
+    return app_no_db
+
+
+@pytest.fixture
+def db_session(app_with_db):
+    """Session whose writes are rolled back after each test.
+
+    The schema is created once; each test runs inside an outer transaction
+    on a dedicated connection and ``commit()`` only releases a SAVEPOINT, so
+    teardown is a single ROLLBACK instead of drop/create DDL.
+    """
+    engines = db.engines
+    engine = engines[None]
+    connection = engine.connect()
+
+    # pysqlite starts transactions lazily and would let SAVEPOINT/RELEASE
+    # commit for real; take over transaction control and BEGIN explicitly.
+    dbapi_connection = connection.connection.driver_connection
+    dbapi_connection.isolation_level = None
+    transaction = connection.begin()
+    connection.exec_driver_sql("BEGIN")
+
+    db.session.remove()
+    engines[None] = connection
+    db.session.configure(join_transaction_mode="create_savepoint")
+
+    yield db.session
+
+    db.session.remove()
+    db.session.configure(join_transaction_mode="conditional_savepoint")
+    engines[None] = engine
+    transaction.rollback()
+    dbapi_connection.isolation_level = ""
+    connection.close()
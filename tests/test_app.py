@@ -1,8 +1,14 @@
+import base64
+import time
+
+import orjson
 import pytest
 from unittest.mock import patch
+from sqlalchemy import inspect
 from sqlalchemy.exc import SQLAlchemyError
 from app import create_app
 from app.models import db, Todo
+from app.routes import MAX_PAGE_SIZE, _last_healthy_probe
 
 
 @pytest.fixture
@@ -14,7 +20,10 @@ def app():
         db.create_all()
         yield app
         db.session.remove()
-        db.drop_all()
+        # The schema lives on the session-wide shared engine; clear rows only
+        for table in reversed(db.metadata.sorted_tables):
+            db.session.execute(table.delete())
+        db.session.commit()
 
 
 @pytest.fixture
@@ -52,6 +61,43 @@ class TestHealthCheck:
         assert data["database"] == "disconnected"
         assert "error" in data
 
+    def test_health_endpoint_missing_schema(self, client, app):
+        """Test health check returns 503 when the todos table has not been created"""
+        db.drop_all()
+        try:
+            response = client.get("/api/health")
+        finally:
+            db.session.rollback()
+            db.create_all()
+
+        assert response.status_code == 503
+        assert response.get_json()["status"] == "unhealthy"
+
+    def test_health_endpoint_caches_success(self, client, app):
+        """Test a healthy probe is reused within the cache window"""
+        app.config["HEALTH_CHECK_CACHE_SECONDS"] = 60
+        assert client.get("/api/health").status_code == 200
+
+        with patch("app.routes.db.session.execute") as mock_execute:
+            response = client.get("/api/health")
+            mock_execute.assert_not_called()
+        assert response.status_code == 200
+
+    def test_health_endpoint_failure_clears_cache(self, client, app):
+        """Test a failed probe is not cached so recovery is detected immediately"""
+        # Seed a recent success, then force a probe by closing the cache window
+        _last_healthy_probe[0] = time.monotonic()
+        app.config["HEALTH_CHECK_CACHE_SECONDS"] = 0
+        with patch("app.routes.db.session.execute") as mock_execute:
+            mock_execute.side_effect = Exception("Database connection failed")
+            assert client.get("/api/health").status_code == 503
+
+        # Widening the window again must not resurrect the earlier success
+        app.config["HEALTH_CHECK_CACHE_SECONDS"] = 60
+        with patch("app.routes.db.session.execute") as mock_execute:
+            mock_execute.side_effect = Exception("Database connection failed")
+            assert client.get("/api/health").status_code == 503
+
 
 class TestTodoAPI:
     """Test Todo CRUD operations"""
@@ -89,6 +135,14 @@ class TestTodoAPI:
         assert data["data"]["title"] == "Test Todo Only Title"
         assert data["data"]["description"] == ""
 
+    def test_create_todo_with_null_description(self, client):
+        """Test creating todo with an explicit null description stores null"""
+        response = client.post("/api/todos", json={"title": "No description", "description": None})
+        assert response.status_code == 201
+        data = response.get_json()
+        assert data["success"] is True
+        assert data["data"]["description"] is None
+
     def test_create_todo_without_title(self, client):
         """Test creating todo without title fails validation"""
         response = client.post("/api/todos", json={})
@@ -116,6 +170,14 @@ class TestTodoAPI:
         assert data["success"] is False
         assert "error" in data
 
+    def test_create_todo_with_invalid_types(self, client):
+        """Test creating todo with a non-string title is rejected by the schema"""
+        response = client.post("/api/todos", json={"title": 123})
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data["success"] is False
+        assert "title" in data["error"]
+
     def test_get_todo_by_id(self, client, app):
         """Test getting a specific todo by ID"""
         with app.app_context():
@@ -204,6 +266,41 @@ class TestTodoAPI:
         assert data["data"]["description"] == "New Description"
         assert data["data"]["completed"] is True
 
+    def test_update_todo_keeps_omitted_fields(self, client, app):
+        """Test fields missing from the update body are left unchanged"""
+        with app.app_context():
+            todo = Todo(title="Keep", description="Keep me")
+            db.session.add(todo)
+            db.session.commit()
+            todo_id = todo.id
+
+        response = client.put(f"/api/todos/{todo_id}", json={"completed": True})
+        assert response.status_code == 200
+        data = response.get_json()["data"]
+        assert data["title"] == "Keep"
+        assert data["description"] == "Keep me"
+        assert data["completed"] is True
+
+    def test_update_todo_bumps_updated_at(self, client):
+        """Test update refreshes updated_at so the list ETag is invalidated"""
+        created = client.post("/api/todos", json={"title": "Before"}).get_json()["data"]
+        etag = client.get("/api/todos").headers["ETag"]
+
+        updated = client.put(f"/api/todos/{created['id']}", json={"title": "After"}).get_json()["data"]
+        assert updated["updated_at"] > created["updated_at"]
+        assert updated["created_at"] == created["created_at"]
+
+        response = client.get("/api/todos", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+
+    def test_update_todo_with_empty_body(self, client):
+        """Test an update with no fields returns the todo unchanged"""
+        created = client.post("/api/todos", json={"title": "Same"}).get_json()["data"]
+
+        response = client.put(f"/api/todos/{created['id']}", json={})
+        assert response.status_code == 200
+        assert response.get_json()["data"] == created
+
     def test_update_nonexistent_todo(self, client):
         """Test updating a todo that doesn't exist"""
         response = client.put("/api/todos/9999", json={"title": "Updated"})
@@ -211,8 +308,13 @@ class TestTodoAPI:
         data = response.get_json()
         assert data["success"] is False
 
-    @patch("app.routes.db.session.commit")
-    def test_update_todo_database_error(self, mock_commit, client, app):
+    def test_update_nonexistent_todo_with_malformed_body(self, client):
+        """Test body validation runs before the existence check"""
+        response = client.put("/api/todos/9999", data="{not json", content_type="application/json")
+        assert response.status_code == 400
+        assert "Invalid request body" in response.get_json()["error"]
+
+    def test_update_todo_database_error(self, client, app):
         """Test database error during todo update"""
         # สร้าง todo ก่อน (ไม่ถูก mock)
         with app.app_context():
@@ -224,7 +326,10 @@ class TestTodoAPI:
         # แล้วค่อย mock เฉพาะตอน update
         with patch("app.routes.db.session.commit") as mock_commit:
             mock_commit.side_effect = SQLAlchemyError("Database error")
-            client.put(f"/api/todos/{todo_id}", json={"title": "New"})
+            response = client.put(f"/api/todos/{todo_id}", json={"title": "New"})
+
+        assert response.status_code == 500
+        assert response.get_json()["success"] is False
 
     def test_delete_todo(self, client, app):
         """Test deleting a todo"""
@@ -251,8 +356,7 @@ class TestTodoAPI:
         data = response.get_json()
         assert data["success"] is False
 
-    @patch("app.routes.db.session.delete")
-    def test_delete_todo_database_error(self, mock_commit, client, app):
+    def test_delete_todo_database_error(self, client, app):
         """Test database error during todo deletion"""
         with app.app_context():
             todo = Todo(title="Test")
@@ -260,9 +364,10 @@ class TestTodoAPI:
             db.session.commit()
             todo_id = todo.id
 
-        mock_commit.side_effect = SQLAlchemyError("Database error")
+        with patch("app.routes.db.session.commit") as mock_commit:
+            mock_commit.side_effect = SQLAlchemyError("Database error")
+            response = client.delete(f"/api/todos/{todo_id}")
 
-        response = client.delete(f"/api/todos/{todo_id}")
         assert response.status_code == 500
         data = response.get_json()
         assert data["success"] is False
@@ -283,10 +388,101 @@ class TestTodoAPI:
         assert data["data"][0]["title"] == "Todo 3"
         assert data["data"][2]["title"] == "Todo 1"
 
-    @patch("app.routes.Todo.query")
-    def test_get_todos_database_error(self, mock_query, client):
+    def test_get_todos_sets_etag(self, client):
+        """Test todo list response carries an ETag and revalidation headers"""
+        response = client.get("/api/todos")
+        assert response.status_code == 200
+        assert response.headers.get("ETag")
+        assert response.cache_control.max_age == 0
+        assert response.cache_control.must_revalidate is True
+
+    def test_get_todos_not_modified(self, client):
+        """Test matching If-None-Match returns 304 without a body"""
+        client.post("/api/todos", json={"title": "Cached"})
+        etag = client.get("/api/todos").headers["ETag"]
+
+        response = client.get("/api/todos", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == etag
+        assert response.cache_control.max_age == 0
+        assert response.cache_control.must_revalidate is True
+
+    def test_get_todos_not_modified_weak_etag(self, client):
+        """Test a weakened ETag from a proxy still revalidates to 304"""
+        etag = client.get("/api/todos").headers["ETag"]
+
+        response = client.get("/api/todos", headers={"If-None-Match": f"W/{etag}"})
+        assert response.status_code == 304
+
+    def test_get_todos_etag_changes_after_write(self, client):
+        """Test ETag changes when the collection is modified"""
+        etag = client.get("/api/todos").headers["ETag"]
+        client.post("/api/todos", json={"title": "New"})
+
+        response = client.get("/api/todos", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.get_json()["count"] == 1
+
+    def test_get_todos_matches_to_dict(self, client, app):
+        """Test list items have the same shape as the single-item representation"""
+        with app.app_context():
+            todo = Todo(title="Shape", description="Check")
+            db.session.add(todo)
+            db.session.commit()
+            expected = orjson.loads(orjson.dumps(todo.to_dict()))
+
+        response = client.get("/api/todos")
+        assert response.get_json()["data"] == [expected]
+
+    def test_get_todos_paginates_with_cursor(self, client, app):
+        """Test limit caps the page and next_cursor walks the remaining todos"""
+        with app.app_context():
+            db.session.add_all([Todo(title=f"Todo {i}") for i in range(1, 6)])
+            db.session.commit()
+
+        first = client.get("/api/todos?limit=2").get_json()
+        assert [t["title"] for t in first["data"]] == ["Todo 5", "Todo 4"]
+        assert first["next_cursor"]
+
+        second = client.get(f"/api/todos?limit=2&cursor={first['next_cursor']}").get_json()
+        assert [t["title"] for t in second["data"]] == ["Todo 3", "Todo 2"]
+
+        last = client.get(f"/api/todos?limit=2&cursor={second['next_cursor']}").get_json()
+        assert [t["title"] for t in last["data"]] == ["Todo 1"]
+        assert last["next_cursor"] is None
+
+    def test_get_todos_limit_is_capped(self, client, app):
+        """Test oversized limit is clamped to the server maximum"""
+        with app.app_context():
+            db.session.add_all([Todo(title=f"Todo {i}") for i in range(MAX_PAGE_SIZE + 1)])
+            db.session.commit()
+
+        data = client.get(f"/api/todos?limit={MAX_PAGE_SIZE * 10}").get_json()
+        assert data["count"] == MAX_PAGE_SIZE
+        assert data["next_cursor"] is not None
+
+    def test_get_todos_invalid_pagination_params(self, client):
+        """Test malformed limit or cursor is rejected"""
+        response = client.get("/api/todos?limit=abc")
+        assert response.status_code == 400
+        assert response.get_json()["success"] is False
+
+        response = client.get("/api/todos?cursor=not-a-cursor")
+        assert response.status_code == 400
+        assert response.get_json()["success"] is False
+
+        for raw in ("2020-01-01T00:00:00," + "9" * 30, ",1", "2020-01-01T00:00:00,0"):
+            cursor = base64.urlsafe_b64encode(raw.encode()).decode()
+            response = client.get(f"/api/todos?cursor={cursor}")
+            assert response.status_code == 400, raw
+            assert response.get_json()["success"] is False
+
+    @patch("app.routes.db.session.execute")
+    def test_get_todos_database_error(self, mock_execute, client):
         """Test database error when getting todos"""
-        mock_query.order_by.return_value.all.side_effect = SQLAlchemyError("DB Error")
+        mock_execute.side_effect = SQLAlchemyError("DB Error")
 
         response = client.get("/api/todos")
         assert response.status_code == 500
@@ -310,6 +506,35 @@ class TestAppFactory:
         assert "message" in data
         assert "version" in data
         assert "endpoints" in data
+        assert response.cache_control.public is True
+        assert response.cache_control.max_age == 3600
+
+    def test_init_db_command(self, app, runner):
+        """Test init-db CLI command creates the schema"""
+        db.drop_all()
+        assert "todos" not in inspect(db.engine).get_table_names()
+
+        result = runner.invoke(args=["init-db"])
+        assert result.exit_code == 0
+        assert "Initialized" in result.output
+        assert "todos" in inspect(db.engine).get_table_names()
+
+    def test_init_db_command_adds_missing_indexes(self, app, runner):
+        """Test init-db adds model indexes to a todos table that already exists"""
+        for index in Todo.__table__.indexes:
+            index.drop(db.engine)
+        assert inspect(db.engine).get_indexes("todos") == []
+
+        result = runner.invoke(args=["init-db"])
+        assert result.exit_code == 0
+        index_names = {ix["name"] for ix in inspect(db.engine).get_indexes("todos")}
+        assert index_names == {ix.name for ix in Todo.__table__.indexes}
+
+    def test_trailing_slash_is_not_redirected(self, client):
+        """Test trailing slash is served directly instead of redirecting"""
+        response = client.get("/api/todos/")
+        assert response.status_code == 200
+        assert response.get_json()["success"] is True
 
     def test_404_error_handler(self, client):
         """Test 404 error handler"""
@@ -338,36 +563,6 @@ class TestAppFactory:
         app.config["TESTING"] = True
 
 
-class TestTodoModel:
-    """Test Todo model methods"""
-
-    def test_todo_to_dict(self, app):
-        """Test todo model to_dict method"""
-        with app.app_context():
-            todo = Todo(title="Test Todo", description="Test Description")
-            db.session.add(todo)
-            db.session.commit()
-
-            todo_dict = todo.to_dict()
-            assert todo_dict["title"] == "Test Todo"
-            assert todo_dict["description"] == "Test Description"
-            assert todo_dict["completed"] is False
-            assert "id" in todo_dict
-            assert "created_at" in todo_dict
-            assert "updated_at" in todo_dict
-
-    def test_todo_repr(self, app):
-        """Test todo model __repr__ method"""
-        with app.app_context():
-            todo = Todo(title="Test Todo")
-            db.session.add(todo)
-            db.session.commit()
-
-            repr_str = repr(todo)
-            assert "Todo" in repr_str
-            assert "Test Todo" in repr_str
-
-
 class TestIntegration:
     """Integration tests for complete workflows"""
 
@@ -492,6 +687,8 @@ def test_head_root_ok(client):
     """HEAD / ควรตอบ 200 เช่นเดียวกับ GET /"""
     res = client.head("/")
     assert res.status_code == 200
+    assert res.data == b""
+    assert res.content_length == len(client.get("/").data)
 
 
 def test_options_todos_ok(client):
@@ -1,6 +1,7 @@
 import os
 import pytest
 
+from app import create_app
 from app.config import (
     Config,
     DevelopmentConfig,
@@ -10,21 +11,30 @@ from app.config import (
 )
 
 
-class TestConfig:
-    """Base configuration"""
+CONFIG_ATTRIBUTES = [
+    (Config, "SECRET_KEY", lambda v: v is not None),
+    (Config, "SQLALCHEMY_TRACK_MODIFICATIONS", lambda v: v is False),
+    (Config, "SQLALCHEMY_ENGINE_OPTIONS", lambda v: v["pool_pre_ping"] is True and v["pool_size"] > 0),
+    (DevelopmentConfig, "DEBUG", lambda v: v is True),
+    (TestingConfig, "TESTING", lambda v: v is True),
+    (TestingConfig, "SQLALCHEMY_DATABASE_URI", lambda v: "sqlite:///:memory:" in v),
+    (TestingConfig, "WTF_CSRF_ENABLED", lambda v: v is False),
+    (ProductionConfig, "DEBUG", lambda v: v is False),
+]
 
-    def test_base_has_secret_and_no_track_mod(self):
-        assert hasattr(Config, "SECRET_KEY")
-        assert Config.SECRET_KEY is not None
-        assert Config.SQLALCHEMY_TRACK_MODIFICATIONS is False
+
+@pytest.mark.parametrize(
+    "config_cls, attr, predicate",
+    CONFIG_ATTRIBUTES,
+    ids=[f"{config_cls.__name__}.{attr}" for config_cls, attr, _ in CONFIG_ATTRIBUTES],
+)
+def test_config_attributes(config_cls, attr, predicate):
+    assert predicate(getattr(config_cls, attr))
 
 
 class TestDevelopmentConfig:
     """Development configuration"""
 
-    def test_debug_enabled(self):
-        assert DevelopmentConfig.DEBUG is True
-
     def test_has_database_uri_default_or_env(self, monkeypatch):
         # ไม่มี DATABASE_URL -> ควรมีค่า default ให้ใช้งานได้
         monkeypatch.delenv("DATABASE_URL", raising=False)
@@ -36,34 +46,16 @@ class TestDevelopmentConfig:
         assert "postgresql://" in os.environ["DATABASE_URL"]
 
 
-class TestTestingConfig:
-    """Testing configuration"""
-
-    def test_testing_enabled(self):
-        assert TestingConfig.TESTING is True
-
-    def test_uses_sqlite_memory(self):
-        assert "sqlite:///:memory:" in TestingConfig.SQLALCHEMY_DATABASE_URI
-
-    def test_csrf_disabled(self):
-        assert TestingConfig.WTF_CSRF_ENABLED is False
-
-
 class TestProductionConfig:
     """Production configuration"""
 
-    def test_debug_disabled(self):
-        assert ProductionConfig.DEBUG is False
-
     def test_requires_database_url(self, monkeypatch):
         """
-        Production ต้องมี DATABASE_URL เสมอ (assert ใน init_app)
+        Production ต้องมี DATABASE_URL เสมอ (assert ใน validate ซึ่ง init_app เรียกใช้)
         """
         monkeypatch.delenv("DATABASE_URL", raising=False)
-        from app import create_app
-
         with pytest.raises(AssertionError):
-            _ = create_app("production")
+            ProductionConfig.validate()
 
     def test_init_app_passes_when_database_url_present(self, monkeypatch):
         """
@@ -81,24 +73,23 @@ class TestProductionConfig:
             "sqlite:///:memory:",
             raising=False,
         )
+        monkeypatch.setattr(ProductionConfig, "SQLALCHEMY_ENGINE_OPTIONS", {}, raising=False)
 
         # 3) ค่อยสร้างแอป
-        from app import create_app
-
         app = create_app("production")
         assert app is not None
         assert app.config["DEBUG"] is False
         assert app.config["SQLALCHEMY_DATABASE_URI"] == "sqlite:///:memory:"
 
 
-class TestConfigSelector:
-    """Selector mapping"""
-
-    def test_config_contains_all_environments(self):
-        assert "development" in config
-        assert "testing" in config
-        assert "production" in config
-        assert "default" in config
-
-    def test_default_is_development(self):
-        assert config["default"] == DevelopmentConfig
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("development", DevelopmentConfig),
+        ("testing", TestingConfig),
+        ("production", ProductionConfig),
+        ("default", DevelopmentConfig),
+    ],
+)
+def test_config_selector(name, expected):
+    assert config[name] is expected
@@ -0,0 +1,39 @@
+import pytest
+from sqlalchemy import func, select
+
+from app.models import Todo
+
+
+class TestTodoModel:
+    """Test Todo model methods"""
+
+    def test_todo_to_dict(self, db_session):
+        """Test todo model to_dict method"""
+        todo = Todo(title="Test Todo", description="Test Description")
+        db_session.add(todo)
+        db_session.commit()
+
+        todo_dict = todo.to_dict()
+        assert todo_dict["title"] == "Test Todo"
+        assert todo_dict["description"] == "Test Description"
+        assert todo_dict["completed"] is False
+        assert "id" in todo_dict
+        assert "created_at" in todo_dict
+        assert "updated_at" in todo_dict
+
+    def test_todo_repr(self, db_session):
+        """Test todo model __repr__ method"""
+        todo = Todo(title="Test Todo")
+        db_session.add(todo)
+        db_session.commit()
+
+        repr_str = repr(todo)
+        assert "Todo" in repr_str
+        assert "Test Todo" in repr_str
+
+    @pytest.mark.parametrize("attempt", range(3))
+    def test_db_session_rolls_back_between_tests(self, db_session, attempt):
+        """Test commits made through db_session do not leak into the next test"""
+        assert db_session.execute(select(func.count(Todo.id))).scalar() == 0
+        db_session.add(Todo(title=f"Leak check {attempt}"))
+        db_session.commit()